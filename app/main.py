@@ -2,65 +2,100 @@
 from fastapi import FastAPI, UploadFile, File, Depends, Request, Form
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import ORJSONResponse, HTMLResponse
+from jinja2 import FileSystemBytecodeCache
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, func
+from sqlalchemy import select, update, exists, desc, func, or_, cast, literal, tuple_, String
 from datetime import datetime, timedelta, timezone
+import asyncio
 import os
+import shutil
+import tempfile
 from pathlib import Path
 from typing import Optional
+from contextlib import asynccontextmanager
 
-from app.database import engine, Base, get_db
+from app.database import engine, Base, AsyncSessionLocal, get_db, warm_connection_pool
 from app.models import LeafLog, Plant, Garden
-from app.ml_engine import process_image
+from app.ml_engine import load_model, process_image_path, stop_logging
+
+# Jinja2 templates (compiled bytecode is cached on disk across restarts)
+TEMPLATES_DIR = Path("app/templates")
+JINJA_CACHE_DIR = Path(".jinja_cache")
+JINJA_CACHE_DIR.mkdir(exist_ok=True)
+templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+templates.env.bytecode_cache = FileSystemBytecodeCache(str(JINJA_CACHE_DIR))
+
+
+def precompile_templates():
+    """Compile every template once so the first request to each page skips parsing."""
+    for path in TEMPLATES_DIR.rglob("*.html"):
+        templates.env.get_template(path.relative_to(TEMPLATES_DIR).as_posix())
+
+
+def create_schema(connection):
+    """Create missing tables and indexes."""
+    Base.metadata.create_all(connection)
+    # create_all skips indexes on tables that already exist
+    for index in LeafLog.__table__.indexes:
+        index.create(connection, checkfirst=True)
+
+
+# Lifespan: create tables and warm caches on startup, release the pool on shutdown
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Prepare the database, connection pool and templates before serving."""
+    # Create tables and default garden in a single session + transaction
+    async with AsyncSessionLocal() as db, db.begin():
+        await db.run_sync(lambda session: create_schema(session.connection()))
+        print("✅ Database tables created successfully (Garden, Plant, LeafLog)")
+        
+        # Create default garden if none exists
+        has_garden = (await db.execute(select(exists().select_from(Garden)))).scalar()
+        if not has_garden:
+            db.add(Garden(
+                name="Garden Utama",
+                rows=4,
+                cols=4,
+                description="Garden default 4×4",
+                is_active=True
+            ))
+            print("✅ Created default garden: Garden Utama (4×4)")
+    
+    # Open pooled connections up front to avoid cold-start latency
+    await warm_connection_pool()
+    print("✅ Database connection pool warmed")
+    
+    precompile_templates()
+    print("✅ Templates precompiled")
+    
+    # Load and warm up the model before the first scan request
+    await asyncio.to_thread(load_model)
+    
+    yield
+    
+    await engine.dispose()
+    stop_logging()
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Smart Garden Manager v2",
     description="Garden monitoring with spatial mapping based in YOLOv11-seg",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # orjson serializes datetimes natively
 )
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
-# Jinja2 templates
-templates = Jinja2Templates(directory="app/templates")
-
-
-# Startup event: Create tables
-@app.on_event("startup")
-async def startup_event():
-    """Create database tables on startup."""
-    from sqlalchemy.orm import selectinload
-    
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    print("✅ Database tables created successfully (Garden, Plant, LeafLog)")
-    
-    # Create default garden if none exists
-    async with AsyncSession(engine) as db:
-        result = await db.execute(select(Garden))
-        gardens = result.scalars().all()
-        
-        if not gardens:
-            default_garden = Garden(
-                name="Garden Utama",
-                rows=4,
-                cols=4,
-                description="Garden default 4×4",
-                is_active=True
-            )
-            db.add(default_garden)
-            await db.commit()
-            print("✅ Created default garden: Garden Utama (4×4)")
-
 
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     """Health check for Docker."""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return {"status": "healthy", "timestamp": datetime.now()}
 
 
 # Dashboard page (NEW: Garden Grid Layout with Multi-Garden Support)
@@ -75,40 +110,31 @@ async def dashboard(
     
     # Load active garden or specified garden
     if garden_id:
-        result = await db.execute(
+        garden_query = (
             select(Garden)
             .options(selectinload(Garden.plants))
             .where(Garden.id == garden_id)
         )
-        garden = result.scalar_one_or_none()
     else:
-        # Get active garden
-        result = await db.execute(
+        # Get active garden, falling back to first garden if none active
+        garden_query = (
             select(Garden)
             .options(selectinload(Garden.plants))
-            .where(Garden.is_active == True)
+            .order_by(Garden.is_active.desc(), Garden.created_at)
+            .limit(1)
         )
-        garden = result.scalar_one_or_none()
-        
-        # Fallback to first garden if none active
-        if not garden:
-            result = await db.execute(
-                select(Garden)
-                .options(selectinload(Garden.plants))
-                .order_by(Garden.created_at)
-                .limit(1)
-            )
-            garden = result.scalar_one_or_none()
     
-    # Load all gardens for selector
-    result = await db.execute(select(Garden).order_by(Garden.created_at))
-    all_gardens = result.scalars().all()
+    # Load all gardens for selector concurrently on a second pooled connection
+    async with AsyncSessionLocal() as selector_db:
+        garden_result, gardens_result = await asyncio.gather(
+            db.execute(garden_query),
+            selector_db.execute(select(Garden).order_by(Garden.created_at))
+        )
+        garden = garden_result.scalar_one_or_none()
+        all_gardens = gardens_result.scalars().all()
     
     # Create grid dictionary: {(x, y): plant}
-    plants_grid = {}
-    if garden:
-        for plant in garden.plants:
-            plants_grid[(plant.grid_x, plant.grid_y)] = plant
+    plants_grid = {(p.grid_x, p.grid_y): p for p in garden.plants} if garden else {}
     
     return templates.TemplateResponse(
         "dashboard.html",
@@ -134,47 +160,158 @@ async def guide(request: Request):
     )
 
 
+# History page size (keyset pagination)
+HISTORY_PAGE_SIZE = 25
+
+
+async def fetch_history_page(
+    db: AsyncSession,
+    cursor: Optional[datetime] = None,
+    cursor_id: Optional[int] = None,
+    search: Optional[str] = None,
+    plant_id: Optional[int] = None,
+    coin_detected: Optional[bool] = None,
+    limit: int = HISTORY_PAGE_SIZE
+) -> dict:
+    """
+    Fetch one page of scan history, newest first.
+    
+    Pages are keyed on (created_at, id) of the last row of the previous page,
+    so each page is an index range scan instead of an OFFSET.
+    """
+    query = (
+        select(
+            LeafLog.id,
+            LeafLog.plant_id,
+            LeafLog.created_at,
+            LeafLog.leaf_area_cm2,
+            LeafLog.coin_detected,
+            LeafLog.segmented_image_path,
+            Plant.name.label("plant_name")
+        )
+        .outerjoin(Plant, LeafLog.plant_id == Plant.id)
+    )
+    
+    if cursor is not None:
+        if cursor_id is not None:
+            # Bind the cursor with the column type (timestamptz); a bare datetime
+            # is sent as naive TIMESTAMP and asyncpg rejects the aware value
+            query = query.where(
+                tuple_(LeafLog.created_at, LeafLog.id)
+                < tuple_(literal(cursor, LeafLog.created_at.type), cursor_id)
+            )
+        else:
+            query = query.where(LeafLog.created_at < cursor)
+    if search:
+        query = query.where(or_(
+            Plant.name.icontains(search, autoescape=True),
+            cast(LeafLog.id, String).contains(search, autoescape=True)
+        ))
+    if plant_id is not None:
+        query = query.where(LeafLog.plant_id == plant_id)
+    if coin_detected is not None:
+        query = query.where(LeafLog.coin_detected == coin_detected)
+    
+    # Fetch one extra row to know whether another page exists
+    query = query.order_by(LeafLog.created_at.desc(), LeafLog.id.desc()).limit(limit + 1)
+    rows = (await db.execute(query)).all()
+    
+    return {
+        "scans": [
+            {
+                "id": row.id,
+                "plant_name": row.plant_name or "Unknown",
+                "plant_id": row.plant_id,
+                "created_at": row.created_at.isoformat(),
+                "leaf_area_cm2": row.leaf_area_cm2,
+                "coin_detected": row.coin_detected,
+                "segmented_image_path": row.segmented_image_path
+            }
+            for row in rows[:limit]
+        ],
+        "has_more": len(rows) > limit
+    }
+
+
 # History page
 @app.get("/history", response_class=HTMLResponse)
 async def history(
     request: Request, 
     db: AsyncSession = Depends(get_db)
 ):
-    """Display scan history with client-side pagination, filters, and search."""
-    from sqlalchemy.orm import selectinload
+    """Display scan history; further pages are loaded from /api/history."""
+    first_page = await fetch_history_page(db)
     
-    # Get all scans (limit to recent 500 for performance)
-    query = select(LeafLog).options(selectinload(LeafLog.plant)).order_by(LeafLog.created_at.desc()).limit(500)
-    result = await db.execute(query)
-    scans = result.scalars().all()
+    return templates.TemplateResponse(
+        "history.html",
+        {
+            "request": request,
+            "first_page": first_page
+        }
+    )
+
+
+# History pages API
+@app.get("/api/history")
+async def get_history_page(
+    cursor: Optional[str] = None,
+    cursor_id: Optional[int] = None,
+    search: Optional[str] = None,
+    plant_id: Optional[int] = None,
+    coin_detected: Optional[bool] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """Get the page of scans older than the (cursor, cursor_id) row."""
+    try:
+        cursor_dt = datetime.fromisoformat(cursor) if cursor else None
+    except ValueError:
+        return ORJSONResponse(
+            status_code=400,
+            content={"error": "Invalid cursor"}
+        )
     
-    # Serialize scans for client-side use
-    scans_data = []
-    for scan in scans:
-        scans_data.append({
-            "id": scan.id,
-            "plant_name": scan.plant.name if scan.plant else "Unknown",
-            "plant_id": scan.plant_id,
-            "created_at": scan.created_at.isoformat(),
-            "leaf_area_cm2": scan.leaf_area_cm2,
-            "coin_detected": scan.coin_detected,
-            "segmented_image_path": scan.segmented_image_path
-        })
+    return await fetch_history_page(
+        db,
+        cursor=cursor_dt,
+        cursor_id=cursor_id,
+        search=search,
+        plant_id=plant_id,
+        coin_detected=coin_detected
+    )
 
-    # Get all plants for filter dropdown
-    plants_result = await db.execute(select(Plant).order_by(Plant.name))
-    all_plants = plants_result.scalars().all()
+
+# Plant filter options (lazy-loaded by the history page)
+@app.get("/api/plants-dropdown", response_class=HTMLResponse)
+async def plants_dropdown(
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+):
+    """Return <option> elements for the history plant filter."""
+    result = await db.execute(select(Plant.id, Plant.name).order_by(Plant.name))
     
     return templates.TemplateResponse(
-        "history.html",
+        "components/plant_options.html",
         {
             "request": request,
-            "scans_json": scans_data,
-            "all_plants": all_plants
+            "plants": result.all()
         }
     )
 
 
+async def save_upload_to_temp(file: UploadFile) -> str:
+    """Copy an upload to a temporary file in chunks and return its path."""
+    suffix = Path(file.filename or "").suffix or ".jpg"
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        try:
+            await asyncio.to_thread(shutil.copyfileobj, file.file, tmp)
+        except BaseException:
+            # The caller never gets the path, so clean up here (disconnect, disk full, cancel)
+            tmp.close()
+            os.remove(tmp.name)
+            raise
+    return tmp.name
+
+
 # Scan API endpoint
 @app.post("/api/scan")
 async def scan_leaf(
@@ -183,14 +320,17 @@ async def scan_leaf(
 ):
     """Process uploaded image and save results."""
     try:
-        # Read image bytes
-        image_bytes = await file.read()
+        # Stream upload to disk instead of buffering it in memory
+        upload_path = await save_upload_to_temp(file)
         
-        # Process with YOLO
-        result = process_image(image_bytes, save_dir="app/static/uploads")
+        # Process with YOLO in a worker thread so the event loop stays free
+        try:
+            result = await asyncio.to_thread(process_image_path, upload_path, save_dir="app/static/uploads")
+        finally:
+            os.remove(upload_path)
         
         if not result["success"]:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"error": result.get("message", "Processing failed")}
             )
@@ -209,7 +349,7 @@ async def scan_leaf(
         await db.commit()
         await db.refresh(leaf_log)
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -217,12 +357,12 @@ async def scan_leaf(
                 "leaf_area_cm2": leaf_log.leaf_area_cm2,
                 "coin_detected": leaf_log.coin_detected,
                 "segmented_image": f"/static/{result['image_paths']['segmented']}",
-                "created_at": leaf_log.created_at.isoformat()
+                "created_at": leaf_log.created_at
             }
         )
         
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"error": str(e)}
         )
@@ -234,8 +374,12 @@ async def scan_leaf(
 @app.get("/api/gardens")
 async def list_gardens(db: AsyncSession = Depends(get_db)):
     """Get all gardens."""
-    result = await db.execute(select(Garden).order_by(Garden.created_at))
-    gardens = result.scalars().all()
+    result = await db.execute(
+        select(Garden, func.count(Plant.id).label("plant_count"))
+        .outerjoin(Plant, Plant.garden_id == Garden.id)
+        .group_by(Garden.id)
+        .order_by(Garden.created_at)
+    )
     
     return [
         {
@@ -245,10 +389,10 @@ async def list_gardens(db: AsyncSession = Depends(get_db)):
             "cols": g.cols,
             "description": g.description,
             "is_active": g.is_active,
-            "plant_count": len(g.plants),
-            "created_at": g.created_at.isoformat()
+            "plant_count": plant_count,
+            "created_at": g.created_at
         }
-        for g in gardens
+        for g, plant_count in result.all()
     ]
 
 
@@ -267,11 +411,8 @@ async def create_garden(
         # If set_active, deactivate others
         if set_active:
             await db.execute(
-                select(Garden).where(Garden.is_active == True)
+                update(Garden).where(Garden.is_active == True).values(is_active=False)
             )
-            result = await db.execute(select(Garden).where(Garden.is_active == True))
-            for g in result.scalars().all():
-                g.is_active = False
         
         garden = Garden(
             name=name,
@@ -286,7 +427,7 @@ async def create_garden(
         
         return {"success": True, "garden_id": garden.id}
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"success": False, "error": str(e)}
         )
@@ -296,31 +437,23 @@ async def create_garden(
 @app.get("/api/gardens/active")
 async def get_active_garden(db: AsyncSession = Depends(get_db)):
     """Get currently active garden."""
-    from sqlalchemy.orm import selectinload
-    
+    # Active garden first, falling back to first garden
     result = await db.execute(
-        select(Garden)
-        .options(selectinload(Garden.plants))
-        .where(Garden.is_active == True)
+        select(Garden, func.count(Plant.id).label("plant_count"))
+        .outerjoin(Plant, Plant.garden_id == Garden.id)
+        .group_by(Garden.id)
+        .order_by(Garden.is_active.desc(), Garden.created_at)
+        .limit(1)
     )
-    garden = result.scalar_one_or_none()
-    
-    if not garden:
-        # Fallback to first garden
-        result = await db.execute(
-            select(Garden)
-            .options(selectinload(Garden.plants))
-            .order_by(Garden.created_at)
-            .limit(1)
-        )
-        garden = result.scalar_one_or_none()
+    row = result.first()
     
-    if not garden:
-        return JSONResponse(
+    if not row:
+        return ORJSONResponse(
             status_code=404,
             content={"error": "No gardens found"}
         )
     
+    garden, plant_count = row
     return {
         "id": garden.id,
         "name": garden.name,
@@ -328,7 +461,7 @@ async def get_active_garden(db: AsyncSession = Depends(get_db)):
         "cols": garden.cols,
         "description": garden.description,
         "is_active": garden.is_active,
-        "plant_count": len(garden.plants)
+        "plant_count": plant_count
     }
 
 
@@ -340,19 +473,20 @@ async def set_active_garden(
 ):
     """Set a garden as active."""
     # Deactivate all
-    result = await db.execute(select(Garden))
-    for g in result.scalars().all():
-        g.is_active = False
+    await db.execute(
+        update(Garden).where(Garden.is_active == True).values(is_active=False)
+    )
     
     # Activate target
-    result = await db.execute(select(Garden).where(Garden.id == garden_id))
-    garden = result.scalar_one_or_none()
-    if garden:
-        garden.is_active = True
+    result = await db.execute(
+        update(Garden).where(Garden.id == garden_id).values(is_active=True)
+    )
+    if result.rowcount:
         await db.commit()
         return {"success": True}
     
-    return JSONResponse(
+    await db.rollback()
+    return ORJSONResponse(
         status_code=404,
         content={"success": False, "error": "Garden not found"}
     )
@@ -371,7 +505,7 @@ async def update_garden(
     garden = result.scalar_one_or_none()
     
     if not garden:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={"success": False, "error": "Garden not found"}
         )
@@ -396,7 +530,7 @@ async def delete_garden(
     garden = result.scalar_one_or_none()
     
     if not garden:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={"success": False, "error": "Garden not found"}
         )
@@ -410,21 +544,24 @@ async def delete_garden(
 @app.get("/api/chart-data")
 async def get_chart_data(days: int = 30, db: AsyncSession = Depends(get_db)):
     """Get data for growth trend chart (last N days)."""
-    cutoff_date = datetime.now() - timedelta(days=days)
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
     
+    # Average leaf area per hour, aggregated in the database
+    bucket = func.date_trunc("hour", LeafLog.created_at).label("bucket")
     result = await db.execute(
-        select(LeafLog)
+        select(bucket, func.avg(LeafLog.leaf_area_cm2).label("avg_area"))
         .where(LeafLog.created_at >= cutoff_date)
-        .order_by(LeafLog.created_at)
+        .group_by(bucket)
+        .order_by(bucket)
     )
-    scans = result.scalars().all()
+    points = result.all()
     
     # Format for Chart.js
     data = {
-        "labels": [scan.created_at.strftime("%Y-%m-%d %H:%M") for scan in scans],
+        "labels": [point.bucket.strftime("%Y-%m-%d %H:%M") for point in points],
         "datasets": [{
             "label": "Leaf Area (cm²)",
-            "data": [scan.leaf_area_cm2 for scan in scans],
+            "data": [point.avg_area for point in points],
             "borderColor": "rgb(34, 197, 94)",
             "backgroundColor": "rgba(34, 197, 94, 0.1)",
             "fill": True,
@@ -447,7 +584,7 @@ async def get_recent_scans(limit: int = 5, db: AsyncSession = Depends(get_db)):
     return [
         {
             "id": scan.id,
-            "created_at": scan.created_at.isoformat(),
+            "created_at": scan.created_at,
             "leaf_area_cm2": scan.leaf_area_cm2,
             "coin_detected": scan.coin_detected,
             "segmented_image": f"/static/{scan.segmented_image_path}"
@@ -533,11 +670,11 @@ async def scan_detail_modal(
     db: AsyncSession = Depends(get_db)
 ):
     """Return scan detail modal."""
-    from sqlalchemy.orm import selectinload
+    from sqlalchemy.orm import selectinload, raiseload
     
     result = await db.execute(
         select(LeafLog)
-        .options(selectinload(LeafLog.plant))
+        .options(selectinload(LeafLog.plant), raiseload("*"))
         .where(LeafLog.id == scan_id)
     )
     scan = result.scalar_one_or_none()
@@ -599,11 +736,11 @@ async def get_plant_detail(
     db: AsyncSession = Depends(get_db)
 ):
     """Get plant details for clicked grid cell."""
-    from sqlalchemy.orm import selectinload
+    from sqlalchemy.orm import selectinload, raiseload
     
     result = await db.execute(
         select(Plant)
-        .options(selectinload(Plant.scans))  # Eager load scans relationship
+        .options(selectinload(Plant.scans), raiseload("*"))  # Eager load scans, forbid lazy loads
         .where(Plant.grid_x == x, Plant.grid_y == y)
     )
     plant = result.scalar_one_or_none()
@@ -611,18 +748,11 @@ async def get_plant_detail(
     latest_scan = None
     scans_json = []
     if plant:
-        # Get latest scan for this plant
-        scan_result = await db.execute(
-            select(LeafLog)
-            .where(LeafLog.plant_id == plant.id)
-            .order_by(desc(LeafLog.created_at))
-            .limit(1)
-        )
-        latest_scan = scan_result.scalar_one_or_none()
+        # Scans are loaded newest first (see Plant.scans order_by)
+        latest_scan = plant.scans[0] if plant.scans else None
         
         # Serialize scans for client-side pagination
-        sorted_scans = sorted(plant.scans, key=lambda x: x.created_at, reverse=True)
-        for scan in sorted_scans:
+        for scan in plant.scans:
             scans_json.append({
                 "id": scan.id,
                 "leaf_area_cm2": scan.leaf_area_cm2,
@@ -650,11 +780,11 @@ async def get_plant_detail_by_id(
     db: AsyncSession = Depends(get_db)
 ):
     """Get plant details by ID."""
-    from sqlalchemy.orm import selectinload
+    from sqlalchemy.orm import selectinload, raiseload
     
     result = await db.execute(
         select(Plant)
-        .options(selectinload(Plant.scans))
+        .options(selectinload(Plant.scans), raiseload("*"))
         .where(Plant.id == plant_id)
     )
     plant = result.scalar_one_or_none()
@@ -662,17 +792,11 @@ async def get_plant_detail_by_id(
     latest_scan = None
     scans_json = []
     if plant:
-        scan_result = await db.execute(
-            select(LeafLog)
-            .where(LeafLog.plant_id == plant.id)
-            .order_by(desc(LeafLog.created_at))
-            .limit(1)
-        )
-        latest_scan = scan_result.scalar_one_or_none()
+        # Scans are loaded newest first (see Plant.scans order_by)
+        latest_scan = plant.scans[0] if plant.scans else None
         
         # Serialize scans for client-side pagination
-        sorted_scans = sorted(plant.scans, key=lambda x: x.created_at, reverse=True)
-        for scan in sorted_scans:
+        for scan in plant.scans:
             scans_json.append({
                 "id": scan.id,
                 "leaf_area_cm2": scan.leaf_area_cm2,
@@ -739,14 +863,17 @@ async def scan_with_plant(
 ):
     """Process uploaded image with plant assignment."""
     try:
-        # Read image bytes
-        image_bytes = await file.read()
+        # Stream upload to disk instead of buffering it in memory
+        upload_path = await save_upload_to_temp(file)
         
-        # Process with YOLO
-        result = process_image(image_bytes, save_dir="app/static/uploads")
+        # Process with YOLO in a worker thread so the event loop stays free
+        try:
+            result = await asyncio.to_thread(process_image_path, upload_path, save_dir="app/static/uploads")
+        finally:
+            os.remove(upload_path)
         
         if not result["success"]:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"error": result.get("message", "Processing failed")}
             )
@@ -766,7 +893,7 @@ async def scan_with_plant(
         await db.commit()
         await db.refresh(leaf_log)
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -774,13 +901,13 @@ async def scan_with_plant(
                 "leaf_area_cm2": leaf_log.leaf_area_cm2,
                 "coin_detected": leaf_log.coin_detected,
                 "segmented_image": f"/static/{result['image_paths']['segmented']}",
-                "created_at": leaf_log.created_at.isoformat()
+                "created_at": leaf_log.created_at
             },
             headers={"HX-Trigger": "scanCompleted"}
         )
         
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"error": str(e)}
         )
@@ -5,33 +5,189 @@ Refactored from inference.py for web service use.
 import cv2
 import numpy as np
 from ultralytics import YOLO
+from ultralytics.utils.plotting import Annotator, colors
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import Future
 import io
+import logging
+import logging.handlers
+import math
+import os
+import queue
+import shutil
+import threading
+import time
 from PIL import Image
 
+try:
+    import simplejpeg
+except ImportError:  # Fall back to OpenCV's JPEG codec
+    simplejpeg = None
+
+# Logging goes through a queue so request threads never block on stream I/O
+logger = logging.getLogger(__name__)
+_log_level = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), None)
+logger.setLevel(_log_level if isinstance(_log_level, int) else logging.INFO)  # Unknown names fall back to INFO
+logger.propagate = False
+_log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+
+
+def stop_logging():
+    """Flush queued log records and stop the listener thread (call once at shutdown)."""
+    _log_listener.stop()
+
 # Constants
+JPEG_QUALITY = 85
 COIN_DIAMETER_MM = 27.2  # Aluminum 500 IDR (Silver)
-COIN_TRUE_AREA_MM2 = np.pi * ((COIN_DIAMETER_MM / 2) ** 2)  # ~581.05 mm²
+COIN_TRUE_AREA_MM2 = math.pi * (COIN_DIAMETER_MM / 2) ** 2  # ~581.07 mm² (plain float)
 
 # Global model (load once)
-MODEL_PATH = "models/best.pt"
+# Point MODEL_PATH at smaller weights (e.g. a YOLO11n-seg fine-tune) to trade capacity for speed
+MODEL_PATH = os.getenv("MODEL_PATH", "models/best.pt")
+ENGINE_PATH = str(Path(MODEL_PATH).with_suffix(".engine"))  # TensorRT export (see export_model.py)
+INFERENCE_IMGSZ = 640
+ENGINE_MAX_BATCH = 16
+BATCH_MAX_WAIT_S = 0.005  # How long the batcher waits for more requests
+WARMUP_RUNS = 3
 model = None
 
+# Class ids resolved from model.names in load_model()
+COIN_CLS_ID = -1
+LEAF_CLS_ID = -1
+
+
+def _resolve_model_path() -> str:
+    """
+    Pick the TensorRT engine when a CUDA GPU is available, exporting it once
+    if missing. Falls back to the PyTorch checkpoint on CPU-only hosts.
+    """
+    try:
+        import torch
+        import tensorrt  # noqa: F401
+    except ImportError:
+        return MODEL_PATH
+    
+    if not torch.cuda.is_available():
+        return MODEL_PATH
+    
+    if not Path(ENGINE_PATH).exists():
+        # FP16 only where the GPU has native support (compute capability >= 7.0)
+        major, _ = torch.cuda.get_device_capability()
+        half = major >= 7
+        logger.info("🔄 Exporting TensorRT engine (half=%s) to %s...", half, ENGINE_PATH)
+        try:
+            YOLO(MODEL_PATH).export(
+                format="engine",
+                half=half,
+                imgsz=INFERENCE_IMGSZ,
+                dynamic=True,
+                batch=ENGINE_MAX_BATCH,
+                workspace=4
+            )
+        except Exception as e:
+            logger.warning("⚠️ TensorRT export failed, using %s: %s", MODEL_PATH, e)
+            return MODEL_PATH
+    
+    return ENGINE_PATH
+
 
 def load_model():
     """Load YOLO model (called once at startup)."""
-    global model
+    global model, COIN_CLS_ID, LEAF_CLS_ID
     if model is None:
-        print(f"🔄 Loading YOLOv11-seg model from {MODEL_PATH}...")
-        model = YOLO(MODEL_PATH)
-        print(f"✅ Model loaded successfully. Classes: {model.names}")
+        model_path = _resolve_model_path()
+        logger.info("🔄 Loading YOLOv11-seg model from %s...", model_path)
+        model = YOLO(model_path, task="segment")
+        logger.info("✅ Model loaded successfully. Classes: %s", model.names)
+        COIN_CLS_ID = next((i for i, n in model.names.items() if n == 'coin'), -1)
+        LEAF_CLS_ID = next((i for i, n in model.names.items() if n == 'leaf'), -1)
+        warmup_model(model, batch=ENGINE_MAX_BATCH if model_path == ENGINE_PATH else 1)
     return model
 
 
+def warmup_model(yolo_model, batch: int = 1):
+    """
+    Run dummy inferences so CUDA context init, cuDNN autotuning and
+    TensorRT profile selection happen before the first real request.
+    """
+    dummy = np.zeros((INFERENCE_IMGSZ, INFERENCE_IMGSZ, 3), dtype=np.uint8)
+    for _ in range(WARMUP_RUNS):
+        yolo_model(dummy, imgsz=INFERENCE_IMGSZ, verbose=False)
+    if batch > 1:
+        yolo_model([dummy] * batch, imgsz=INFERENCE_IMGSZ, verbose=False)
+    logger.info("✅ Model warmed up (%d runs, max batch %d)", WARMUP_RUNS, batch)
+
+
+class BatchInferencer:
+    """
+    Coalesce concurrent inference requests into batched forward passes.
+    
+    Callers (request worker threads) enqueue an image and block on a Future;
+    a single daemon thread collects up to `max_batch` images or waits at most
+    `max_wait` seconds, runs one model call, and hands each caller its result.
+    Decoding and JPEG encoding stay on the callers' threads, so they overlap
+    with the model call for other requests.
+    """
+    
+    def __init__(self, max_batch: int = ENGINE_MAX_BATCH, max_wait: float = BATCH_MAX_WAIT_S):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+    
+    def infer(self, image):
+        """Run inference on one BGR image and return its ultralytics Results."""
+        future = Future()
+        self._ensure_worker()
+        self._queue.put((image, future))
+        return future.result()
+    
+    def _ensure_worker(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="yolo-batcher", daemon=True)
+                self._thread.start()
+    
+    def _collect_batch(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+    
+    def _run(self):
+        while True:
+            batch = self._collect_batch()
+            images = [image for image, _ in batch]
+            try:
+                results = load_model()(images, imgsz=INFERENCE_IMGSZ, verbose=False)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+
+batch_inferencer = BatchInferencer()
+
+
 def calculate_polygon_area(polygon_coords):
     """
-    Calculate area of polygon using Shoelace formula.
+    Calculate area of polygon (OpenCV's C++ Shoelace implementation).
     
     Args:
         polygon_coords: Array of (x, y) coordinates
@@ -42,15 +198,8 @@ def calculate_polygon_area(polygon_coords):
     if len(polygon_coords) < 3:
         return 0.0
     
-    x = polygon_coords[:, 0]
-    y = polygon_coords[:, 1]
-    
-    # Shoelace formula
-    area = 0.5 * np.abs(
-        np.dot(x, np.roll(y, 1)) - np.dot(y, np.roll(x, 1))
-    )
-    
-    return area
+    # Unsigned area, same as 0.5 * |Shoelace sum|
+    return float(cv2.contourArea(polygon_coords.astype(np.float32)))
 
 
 def process_image(image_bytes: bytes, save_dir: str = "app/static/uploads") -> dict:
@@ -65,22 +214,294 @@ def process_image(image_bytes: bytes, save_dir: str = "app/static/uploads") -> d
     Returns:
         dict with processing results
     """
+    image = _decode_image(image_bytes)
+    return _analyze_image(image, image_bytes, save_dir)
+
+
+def process_image_path(image_path: str, save_dir: str = "app/static/uploads") -> dict:
+    """
+    Same as process_image, but reads the image from a file on disk
+    (e.g. an upload streamed to a temporary file).
+    
+    Args:
+        image_path: Path to the image file
+        save_dir: Directory to save processed images
+        
+    Returns:
+        dict with processing results
+    """
+    image = _decode_image_path(image_path)
+    return _analyze_image(image, image_path, save_dir)
+
+
+def _read_exif(source) -> dict:
+    """Read EXIF tags from upload bytes or a path without decoding pixels (empty if none)."""
+    try:
+        fp = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+        with Image.open(fp) as img:
+            return dict(img.getexif())
+    except Exception:
+        return {}
+
+
+def _exif_orientation(source) -> int:
+    """Read the EXIF orientation tag (1 = upright) from bytes or a path without decoding pixels."""
+    return _read_exif(source).get(0x0112, 1)
+
+
+def _decode_image_path(image_path: str):
+    """
+    Decode an image file to a BGR image.
+    
+    OpenCV reads straight from the path, so the compressed upload is never
+    held in memory. Only upright JPEGs on the simplejpeg path read the file
+    into memory, since simplejpeg decodes from a buffer; the compressed
+    bytes are a fraction of the decoded frame held right after.
+    """
+    with open(image_path, "rb") as f:
+        header = f.read(12)
+    
+    if (
+        simplejpeg is not None
+        and _original_extension(header) == ".jpg"
+        and _exif_orientation(image_path) == 1
+    ):
+        with open(image_path, "rb") as f:
+            try:
+                return simplejpeg.decode_jpeg(f.read(), colorspace="BGR")
+            except ValueError:
+                pass
+    
+    return cv2.imread(image_path, cv2.IMREAD_COLOR)
+
+
+def _decode_image(image_bytes: bytes):
+    """
+    Decode upload bytes to a BGR image.
+    
+    Upright JPEGs go through simplejpeg (libjpeg-turbo); everything else,
+    including rotated phone photos that need EXIF orientation applied,
+    goes through OpenCV.
+    """
+    if (
+        simplejpeg is not None
+        and _original_extension(image_bytes[:12]) == ".jpg"
+        and _exif_orientation(image_bytes) == 1
+    ):
+        try:
+            return simplejpeg.decode_jpeg(image_bytes, colorspace="BGR")
+        except ValueError:
+            pass
+    
+    try:
+        image_array = np.frombuffer(image_bytes, np.uint8)
+        return cv2.imdecode(image_array, cv2.IMREAD_COLOR)
+    except cv2.error:
+        return None
+
+
+def _write_jpeg(path: str, image):
+    """Encode a BGR image as JPEG, using simplejpeg when available."""
+    if simplejpeg is not None:
+        with open(path, "wb") as f:
+            f.write(simplejpeg.encode_jpeg(
+                np.ascontiguousarray(image), quality=JPEG_QUALITY, colorspace="BGR"
+            ))
+    else:
+        cv2.imwrite(path, image, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+
+
+def _original_extension(header: bytes):
+    """Return the file extension for an upload's format, or None if unrecognised."""
+    if header.startswith(b"\xff\xd8\xff"):
+        return ".jpg"
+    if header.startswith(b"\x89PNG"):
+        return ".png"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return ".webp"
+    return None
+
+
+def _copy_jpeg_without_metadata(src, dst):
+    """
+    Copy a JPEG stream, dropping APP1 (EXIF/XMP, incl. GPS) and APP13 (IPTC)
+    segments. Everything from the start-of-scan marker on is copied as-is,
+    so the pixels are not re-encoded.
+    """
+    dst.write(src.read(2))  # SOI
+    while True:
+        marker = src.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF or marker[1] == 0xDA:
+            dst.write(marker)
+            break
+        length_bytes = src.read(2)
+        segment = src.read(int.from_bytes(length_bytes, "big") - 2)
+        if marker[1] not in (0xE1, 0xED):
+            dst.write(marker + length_bytes + segment)
+    shutil.copyfileobj(src, dst)
+
+
+def _save_original(image, source, save_dir: str, timestamp: str) -> str:
+    """
+    Persist the uploaded image as it came off the wire, minus metadata.
+    
+    Uploads are served publicly from static/, so EXIF (e.g. phone GPS
+    location) must not be kept. JPEGs have their metadata segments dropped
+    without re-encoding; rotated JPEGs and PNG/WebP files carrying EXIF are
+    re-encoded from the decoded (already upright) pixels instead.
+    
+    Args:
+        image: Decoded BGR image (used when the upload has to be re-encoded)
+        source: Raw upload bytes or path to the uploaded file
+        save_dir: Directory to save processed images
+        timestamp: Filename prefix shared with the segmented image
+        
+    Returns:
+        Path of the saved file relative to the static directory
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            header = f.read(12)
+    else:
+        header = bytes(source[:12])
+    
+    ext = _original_extension(header)
+    if ext is not None:
+        exif = _read_exif(source)
+        # Stripping EXIF from a rotated JPEG would also drop its orientation
+        if (ext == ".jpg" and exif.get(0x0112, 1) != 1) or (ext != ".jpg" and exif):
+            ext = None
+    
+    filename = f"{timestamp}_original{ext or '.jpg'}"
+    dest = f"{save_dir.rstrip('/')}/{filename}"
+    
+    if ext is None:
+        _write_jpeg(dest, image)
+    else:
+        src = open(source, "rb") if isinstance(source, str) else io.BytesIO(source)
+        with src, open(dest, "wb") as dst:
+            if ext == ".jpg":
+                _copy_jpeg_without_metadata(src, dst)
+            else:
+                shutil.copyfileobj(src, dst)
+    
+    return f"uploads/{filename}"
+
+
+def _letterbox(image, size: int = INFERENCE_IMGSZ, stride: int = 32):
+    """
+    Resize so the long side is `size` (keeping aspect ratio) and pad the
+    short side only up to the next multiple of `stride`, so the model runs
+    on e.g. 640×480 for a 4:3 photo instead of a padded 640×640 square.
+    
+    Returns:
+        (padded image, scale applied, (left, top) offset of the content)
+    """
+    h, w = image.shape[:2]
+    scale = size / max(h, w)
+    new_w, new_h = round(w * scale), round(h * scale)
+    resized = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+    
+    pad_w = -new_w % stride
+    pad_h = -new_h % stride
+    top = pad_h // 2
+    left = pad_w // 2
+    padded = cv2.copyMakeBorder(
+        resized, top, pad_h - top, left, pad_w - left,
+        cv2.BORDER_CONSTANT, value=(114, 114, 114)
+    )
+    return padded, scale, (left, top)
+
+
+_scratch = threading.local()
+SCRATCH_MAX_BYTES = 1920 * 1920 * 3  # Larger uploads get a per-request buffer instead
+
+
+def _scratch_buffer(name: str, shape):
+    """
+    Return a uint8 array of `shape` backed by this thread's reusable buffer `name`.
+    
+    The buffer is flat, so portrait and landscape uploads of the same size
+    share it. Images above SCRATCH_MAX_BYTES are allocated per request and
+    not retained, which bounds the memory each worker thread keeps alive.
+    """
+    size = int(np.prod(shape))
+    if size > SCRATCH_MAX_BYTES:
+        return np.empty(shape, dtype=np.uint8)
+    
+    buffer = getattr(_scratch, name, None)
+    if buffer is None or buffer.size < size:
+        buffer = np.empty(size, dtype=np.uint8)
+        setattr(_scratch, name, buffer)
+    return buffer[:size].reshape(shape)
+
+
+def _plot_content(results, image, scale, offset):
+    """
+    Plot detections onto the original (full-resolution) image.
+    
+    Masks and boxes come back in letterboxed pixels; they are mapped to the
+    original image by removing the padding `offset` and dividing by `scale`.
+    Drawing happens on per-thread scratch buffers (see _scratch_buffer).
+    """
+    left, top = offset
+    canvas = _scratch_buffer("canvas", image.shape)
+    np.copyto(canvas, image)
+    classes = results.boxes.cls.int().tolist()
+    
+    if results.masks is not None:
+        # Fill masks on a copy and blend once at 50% like results.plot()
+        overlay = _scratch_buffer("overlay", image.shape)
+        np.copyto(overlay, canvas)
+        shift = np.array([left, top], dtype=np.float32)
+        for polygon, c in zip(results.masks.xy, classes):
+            if len(polygon):
+                points = np.round((polygon - shift) / scale).astype(np.int32)
+                cv2.fillPoly(overlay, [points], colors(c, True))
+        cv2.addWeighted(overlay, 0.5, canvas, 0.5, 0, dst=canvas)
+    
+    annotator = Annotator(canvas, example=results.names)
+    boxes = (results.boxes.xyxy.cpu().numpy() - [left, top, left, top]) / scale
+    for box, c, conf in zip(boxes.tolist(), classes, results.boxes.conf.tolist()):
+        annotator.box_label(box, f"{results.names[c]} {conf:.2f}", color=colors(c, True))
+    
+    return annotator.result()
+
+
+def _draw_text_lines(image, lines):
+    """
+    Draw overlay text in one pass, scaled to the image width.
+    
+    Args:
+        image: BGR image to draw on (modified in place)
+        lines: List of (text, y, color, font_scale) at 900px-wide layout
+    """
+    text_scale = min(1.0, image.shape[1] / 900)  # Fit text to image width
+    for text, y, color, font_scale in lines:
+        cv2.putText(
+            image, text, (int(30 * text_scale), int(y * text_scale)),
+            cv2.FONT_HERSHEY_SIMPLEX, font_scale * text_scale, color, 2
+        )
+
+
+def _analyze_image(image, source, save_dir: str) -> dict:
+    """Run detection and area calculation on a decoded BGR image from `source`."""
     try:
         # Load model if not already loaded
         load_model()
         
-        # Decode image from bytes
-        image_array = np.frombuffer(image_bytes, np.uint8)
-        image = cv2.imdecode(image_array, cv2.IMREAD_COLOR)
-        
         if image is None:
             return {
                 "success": False,
                 "message": "Failed to decode image"
             }
         
-        # Run YOLOv11 inference
-        results = model(image)[0]
+        # Letterbox once to the model input size; coordinates below are in
+        # letterboxed pixels and divided by `scale` to get original pixels
+        model_input, scale, offset = _letterbox(image)
+        
+        # Run YOLOv11 inference (batched with concurrent requests)
+        results = batch_inferencer.infer(model_input)
         
         if results.masks is None:
             return {
@@ -88,46 +509,33 @@ def process_image(image_bytes: bytes, save_dir: str = "app/static/uploads") -> d
                 "message": "No objects detected (coin or leaf not found)"
             }
         
-        # Extract classes and masks
+        # Extract classes, boxes and masks (copied to host once)
         classes = results.boxes.cls.cpu().numpy().astype(int)
-        names = results.names
+        boxes_xywh = results.boxes.xywh.cpu().numpy()
+        polygons = results.masks.xy
         
         # Find Coin and Leaf indices
-        coin_idx = -1
-        leaf_idxs = []
-        
-        for i, cls in enumerate(classes):
-            label = names[cls]
-            if label == 'coin':
-                if coin_idx == -1:  # Take first coin detected
-                    coin_idx = i
-            elif label == 'leaf':
-                leaf_idxs.append(i)
+        leaf_idxs = np.flatnonzero(classes == LEAF_CLS_ID)
+        coin_candidates = np.flatnonzero(classes == COIN_CLS_ID)
+        coin_idx = int(coin_candidates[0]) if coin_candidates.size else -1  # Take first coin detected
         
         # Check if coin detected
         coin_detected = coin_idx != -1
         
         if not coin_detected:
             # Generate annotated image without calibration
-            annotated_img = results.plot()
-            cv2.putText(
-                annotated_img,
-                "Reference Coin Not Detected - Cannot Calculate Area",
-                (50, 50),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.8,
-                (0, 0, 255),
-                2
-            )
+            annotated_img = _plot_content(results, image, scale, offset)
+            _draw_text_lines(annotated_img, [
+                ("Reference Coin Not Detected - Cannot Calculate Area", 50, (0, 0, 255), 0.8),
+            ])
             
             # Save images with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-            original_path = f"uploads/{timestamp}_original.jpg"
             segmented_path = f"uploads/{timestamp}_segmented.jpg"
             
             Path(save_dir).mkdir(parents=True, exist_ok=True)
-            cv2.imwrite(f"{save_dir.rstrip('/')}/{timestamp}_original.jpg", image)
-            cv2.imwrite(f"{save_dir.rstrip('/')}/{timestamp}_segmented.jpg", annotated_img)
+            original_path = _save_original(image, source, save_dir, timestamp)
+            _write_jpeg(f"{save_dir.rstrip('/')}/{timestamp}_segmented.jpg", annotated_img)
             
             return {
                 "success": False,
@@ -139,23 +547,21 @@ def process_image(image_bytes: bytes, save_dir: str = "app/static/uploads") -> d
                 }
             }
         
-        # Calculate coin area using shoelace formula
-        coin_poly = results.masks.xy[coin_idx]
-        coin_pixel_area = calculate_polygon_area(coin_poly)
+        # Calculate coin and leaf areas (cv2.contourArea per polygon),
+        # scaled back to original image pixels as plain Python floats
+        area_scale = scale ** 2
+        coin_pixel_area, *leaf_pixel_areas = [
+            calculate_polygon_area(polygons[i]) / area_scale for i in [coin_idx, *leaf_idxs]
+        ]
         
         # Calculate scale factor (mm²/pixel)
         scale_factor = COIN_TRUE_AREA_MM2 / coin_pixel_area
         
-        print(f"🪙 Coin detected. Pixel Area: {coin_pixel_area:.2f}, Scale: {scale_factor:.6f} mm²/px")
-        
         # Calculate leaf areas
         total_leaf_area_mm2 = 0
         leaf_details = []
         
-        for i, leaf_idx in enumerate(leaf_idxs):
-            leaf_poly = results.masks.xy[leaf_idx]
-            leaf_pixel_area = calculate_polygon_area(leaf_poly)
-            
+        for i, leaf_pixel_area in enumerate(leaf_pixel_areas):
             # Convert to real area (mm²)
             real_area_mm2 = leaf_pixel_area * scale_factor
             total_leaf_area_mm2 += real_area_mm2
@@ -166,53 +572,46 @@ def process_image(image_bytes: bytes, save_dir: str = "app/static/uploads") -> d
                 "real_area_mm2": float(real_area_mm2),
                 "real_area_cm2": float(real_area_mm2 / 100)  # Convert to cm²
             })
-            
-            print(f"🍃 Leaf {i+1}: Pixel Area: {leaf_pixel_area:.2f}, Real Area: {real_area_mm2:.2f} mm²")
         
         # Convert total area to cm²
         total_leaf_area_cm2 = total_leaf_area_mm2 / 100
         
+        logger.debug(
+            "🪙 Coin pixel area: %.2f, scale: %.6f mm²/px | 🍃 %d leaves, total %.2f mm²",
+            coin_pixel_area, scale_factor, len(leaf_details), total_leaf_area_mm2
+        )
+        
         # Generate annotated image
-        annotated_img = results.plot()
+        annotated_img = _plot_content(results, image, scale, offset)
         
         # Add text overlays
-        text = f"Total Leaf Area: {total_leaf_area_cm2:.2f} cm^2 ({total_leaf_area_mm2:.1f} mm^2)"
-        cv2.putText(annotated_img, text, (30, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 255, 0), 2)
-        
-        coin_text = f"Coin Ref: {COIN_TRUE_AREA_MM2:.1f} mm^2 ({COIN_DIAMETER_MM}mm)"
-        cv2.putText(annotated_img, coin_text, (30, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 0), 2)
-        
-        leaves_text = f"Leaves Detected: {len(leaf_idxs)}"
-        cv2.putText(annotated_img, leaves_text, (30, 120), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 165, 255), 2)
+        _draw_text_lines(annotated_img, [
+            (f"Total Leaf Area: {total_leaf_area_cm2:.2f} cm^2 ({total_leaf_area_mm2:.1f} mm^2)", 40, (0, 255, 0), 0.9),
+            (f"Coin Ref: {COIN_TRUE_AREA_MM2:.1f} mm^2 ({COIN_DIAMETER_MM}mm)", 80, (255, 0, 0), 0.7),
+            (f"Leaves Detected: {len(leaf_idxs)}", 120, (0, 165, 255), 0.7),
+        ])
         
         # Save images with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        original_path = f"uploads/{timestamp}_original.jpg"
         segmented_path = f"uploads/{timestamp}_segmented.jpg"
         
         Path(save_dir).mkdir(parents=True, exist_ok=True)
-        cv2.imwrite(f"{save_dir.rstrip('/')}/{timestamp}_original.jpg", image)
-        cv2.imwrite(f"{save_dir.rstrip('/')}/{timestamp}_segmented.jpg", annotated_img)
+        original_path = _save_original(image, source, save_dir, timestamp)
+        _write_jpeg(f"{save_dir.rstrip('/')}/{timestamp}_segmented.jpg", annotated_img)
         
         # Calculate leaf constant c (if needed)
         # For now, using simple average approach
         # c = A / (H × W) where H, W are bounding box dimensions
         leaf_constant = None
         if len(leaf_idxs) > 0:
-            # Get average bounding box dimensions
-            total_h = 0
-            total_w = 0
-            for leaf_idx in leaf_idxs:
-                box = results.boxes.xywh[leaf_idx].cpu().numpy()
-                total_w += box[2]  # width
-                total_h += box[3]  # height
-            
-            avg_h = total_h / len(leaf_idxs)
-            avg_w = total_w / len(leaf_idxs)
+            # Get average bounding box dimensions (one device-to-host copy)
+            leaf_boxes = boxes_xywh[leaf_idxs] / scale  # Original image pixels
+            avg_w = leaf_boxes[:, 2].mean()  # width
+            avg_h = leaf_boxes[:, 3].mean()  # height
             
             # Calculate constant in cm units
             # Convert pixel dimensions to cm
-            pixel_to_cm = np.sqrt(scale_factor / 100)  # approximate linear scale
+            pixel_to_cm = math.sqrt(scale_factor) * 0.1  # approximate linear scale, sqrt(sf / 100)
             avg_h_cm = avg_h * pixel_to_cm
             avg_w_cm = avg_w * pixel_to_cm
             
@@ -242,15 +641,9 @@ def process_image(image_bytes: bytes, save_dir: str = "app/static/uploads") -> d
         }
         
     except Exception as e:
-        print(f"❌ Error processing image: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Error processing image: %s", e)
         
         return {
             "success": False,
             "message": f"Processing error: {str(e)}"
         }
-
-
-# Pre-load model on module import
-load_model()
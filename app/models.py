@@ -1,5 +1,5 @@
 """Database models for Go-Dhong Garden Manager."""
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -40,7 +40,12 @@ class Plant(Base):
     
     # Relationships
     garden = relationship("Garden", back_populates="plants")
-    scans = relationship("LeafLog", back_populates="plant", cascade="all, delete-orphan")
+    scans = relationship(
+        "LeafLog",
+        back_populates="plant",
+        cascade="all, delete-orphan",
+        order_by="LeafLog.created_at.desc()"  # Newest first
+    )
     
     # Unique constraint: one plant per grid position (per garden in future)
     __table_args__ = (
@@ -65,5 +70,11 @@ class LeafLog(Base):
     # Relationships
     plant = relationship("Plant", back_populates="scans")
     
+    # Indexes for newest-first listings and per-plant scan lookups
+    __table_args__ = (
+        Index("ix_leaflog_created_at", created_at.desc()),
+        Index("ix_leaflog_plant_created", plant_id, created_at.desc()),
+    )
+    
     def __repr__(self):
         return f"<LeafLog(id={self.id}, area={self.leaf_area_cm2}cm², plant_id={self.plant_id})>"
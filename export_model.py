@@ -0,0 +1,50 @@
+"""
+Export the leaf/coin segmentation model to a TensorRT engine.
+
+FP16 is used by default. Pass a calibration dataset YAML to build an INT8
+engine instead; ultralytics calibrates on a subset of its images. The
+engine is written next to the weights, where app/ml_engine.py picks it up.
+"""
+from ultralytics import YOLO
+import sys
+
+# Must match INFERENCE_IMGSZ / ENGINE_MAX_BATCH in app/ml_engine.py
+IMGSZ = 640
+MAX_BATCH = 16
+
+
+def export_engine(model_path, calib_data=None, fraction=1.0):
+    model = YOLO(model_path, task="segment")
+    
+    if calib_data:
+        # INT8 with calibration on representative leaf images
+        engine_path = model.export(
+            format="engine",
+            int8=True,
+            data=calib_data,
+            fraction=fraction,
+            imgsz=IMGSZ,
+            dynamic=True,
+            batch=MAX_BATCH,
+            workspace=4
+        )
+    else:
+        engine_path = model.export(
+            format="engine",
+            half=True,
+            imgsz=IMGSZ,
+            dynamic=True,
+            batch=MAX_BATCH,
+            workspace=4
+        )
+    
+    print(f"Saved TensorRT engine to {engine_path}")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python export_model.py <model_path> [calib_data.yaml] [fraction]")
+    else:
+        model_p = sys.argv[1]
+        calib_p = sys.argv[2] if len(sys.argv) > 2 else None
+        frac = float(sys.argv[3]) if len(sys.argv) > 3 else 1.0
+        export_engine(model_p, calib_p, frac)
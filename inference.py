@@ -4,42 +4,12 @@ from ultralytics import YOLO
 import sys
 import os
 
+from app.ml_engine import calculate_polygon_area
+
 # Constants
 COIN_DIAMETER_MM = 27.2 # Aluminum 500 IDR (Silver)
 COIN_TRUE_AREA_MM2 = np.pi * ((COIN_DIAMETER_MM / 2) ** 2)
 
-def calculate_area(masks, boxes, class_ids, img_shape):
-    """
-    Finds coin and leaf masks, calculates area.
-    """
-    coin_mask = None
-    leaf_mask = None
-    
-    # Iterate through detections
-    # We assume class 0 = coin, class 1 = leaf
-    
-    # Sort by potential criteria if multiple detections
-    # For now, take the one with highest confidence or largest area?
-    # Masks are usually ordered by confidence.
-    
-    coin_areas = []
-    leaf_areas = []
-    
-    for i, class_id in enumerate(class_ids):
-        mask = masks[i].data[0].cpu().numpy() # Extract mask
-        # Resize mask to original image size if needed, but YOLO usually returns normalized or scaled
-        # ultralytics masks.data are usually in model input size or output size (often smaller).
-        # We need to resize to img_shape.
-        
-        # Actually masks.xy returns coordinates of polygon pixels in original image!
-        # That is better for area calculation 'Polygon Area'.
-        # But for pixel counting, bitmap key is useful.
-        
-        # Let's use the Polygon coordinates provided by ultralytics results[0].masks.xy
-        pass
-
-    return None
-
 def run_inference(model_path, image_path, output_path):
     model = YOLO(model_path)
     
@@ -79,10 +49,7 @@ def run_inference(model_path, image_path, output_path):
     if coin_idx != -1:
         # Get coin mask area
         # Using polygon area (shootlace formula) from .xy
-        coin_poly = results.masks.xy[coin_idx]
-        # Shoelace formula for area
-        coin_pixel_area = 0.5 * np.abs(np.dot(coin_poly[:, 0], np.roll(coin_poly[:, 1], 1)) - 
-                                       np.dot(coin_poly[:, 1], np.roll(coin_poly[:, 0], 1)))
+        coin_pixel_area = calculate_polygon_area(results.masks.xy[coin_idx])
         
         scale_factor = COIN_TRUE_AREA_MM2 / coin_pixel_area
         
@@ -90,9 +57,7 @@ def run_inference(model_path, image_path, output_path):
         
         total_leaf_area = 0
         for i in leaf_idxs:
-            leaf_poly = results.masks.xy[i]
-            leaf_pixel_area = 0.5 * np.abs(np.dot(leaf_poly[:, 0], np.roll(leaf_poly[:, 1], 1)) - 
-                                           np.dot(leaf_poly[:, 1], np.roll(leaf_poly[:, 0], 1)))
+            leaf_pixel_area = calculate_polygon_area(results.masks.xy[i])
             
             real_area = leaf_pixel_area * scale_factor
             total_leaf_area += real_area